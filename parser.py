@@ -1,12 +1,66 @@
 import csv
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
 def filter_autonomous_logs(input_path, output_path):
-    with open(input_path, mode='r', newline='') as infile, open(output_path, mode='w', newline='') as outfile:
-        reader = csv.DictReader(infile)
-        writer = csv.DictWriter(outfile, fieldnames=reader.fieldnames)
+    if pl is not None and _polars_can_filter(input_path):
+        try:
+            _filter_autonomous_logs_polars(input_path, output_path)
+            return
+        except pl.exceptions.PolarsError:
+            # Rows Polars rejects (e.g. more fields than the header) are still
+            # copied through by the csv path, which rewrites the output.
+            pass
+    _filter_autonomous_logs_csv(input_path, output_path)
+
+def _polars_can_filter(input_path):
+    # Headers Polars would rewrite (a UTF-8 BOM, empty or repeated column
+    # names) and files it cannot filter (empty, no RobotMode column) are
+    # handled by the csv path so both backends produce the same output.
+    with open(input_path, mode='r', newline='') as infile:
+        header = next(csv.reader(infile), None)
+    return (
+        bool(header)
+        and "RobotMode" in header
+        and not header[0].startswith('\ufeff')
+        and all(header)
+        and len(set(header)) == len(header)
+    )
+
+def _filter_autonomous_logs_polars(input_path, output_path):
+    # Read every column as a string so values are written back untouched.
+    lf = pl.scan_csv(input_path, infer_schema_length=0)
+    robot_mode = pl.col("RobotMode").str.strip_chars().str.to_lowercase()
+    (
+        lf.filter(robot_mode == "autonomous")
+        # csv.writer writes empty strings unquoted, match that.
+        .with_columns(pl.all().replace("", None))
+        .sink_csv(output_path, line_terminator="\r\n")
+    )
+
+def _filter_autonomous_logs_csv(input_path, output_path):
+    with open(input_path, mode='r', newline='') as infile, open(output_path, mode='w', newline='', buffering=OUTPUT_BUFFER_SIZE) as outfile:
+        reader = csv.reader(infile)
+        writer = csv.writer(outfile)
+
+        header = next(reader, None)
+        if header is None:
+            return
+        writer.writerow(header)
 
-        writer.writeheader()
+        if "RobotMode" not in header:
+            return
+        # DictReader kept the last of any repeated column names.
+        robot_mode = len(header) - 1 - header[::-1].index("RobotMode")
+        width = len(header)
 
         for row in reader:
-            if row.get("RobotMode", "").strip().lower() == "autonomous":
-                writer.writerow(row)
\ No newline at end of file
+            if len(row) > robot_mode and row[robot_mode].strip().lower() == "autonomous":
+                if len(row) < width:
+                    row += [''] * (width - len(row))
+                writer.writerow(row)
@@ -0,0 +1,101 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import parser
+
+SAMPLE_LOG = (
+    'Timestamp,RobotMode,Note\r\n'
+    '1.0,disabled,a\r\n'
+    '2.0, Autonomous ,"b,c"\r\n'
+    '3.0,autonomous,""\r\n'
+    '4.0,autonomous,\r\n'
+    '5.0,autonomous,"say ""hi"""\r\n'
+    '6.0,teleop,d\r\n'
+    '7.0,autonomous\r\n'
+)
+
+class FilterAutonomousLogsTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def write_input(self, text):
+        input_path = self.path("input.csv")
+        with open(input_path, mode='w', newline='') as f:
+            f.write(text)
+        return input_path
+
+    def read_bytes(self, path):
+        with open(path, mode='rb') as f:
+            return f.read()
+
+    def test_csv_filters_autonomous_rows(self):
+        input_path = self.write_input(SAMPLE_LOG)
+        output_path = self.path("csv.csv")
+        parser._filter_autonomous_logs_csv(input_path, output_path)
+        self.assertEqual(
+            self.read_bytes(output_path),
+            b'Timestamp,RobotMode,Note\r\n'
+            b'2.0, Autonomous ,"b,c"\r\n'
+            b'3.0,autonomous,\r\n'
+            b'4.0,autonomous,\r\n'
+            b'5.0,autonomous,"say ""hi"""\r\n'
+            b'7.0,autonomous,\r\n',
+        )
+
+    def test_csv_pads_short_rows(self):
+        input_path = self.write_input('Timestamp,RobotMode,Note\n1,autonomous\n')
+        output_path = self.path("csv.csv")
+        parser._filter_autonomous_logs_csv(input_path, output_path)
+        self.assertEqual(
+            self.read_bytes(output_path),
+            b'Timestamp,RobotMode,Note\r\n1,autonomous,\r\n',
+        )
+
+    def test_csv_uses_last_repeated_robot_mode(self):
+        input_path = self.write_input('RobotMode,RobotMode\nautonomous,teleop\nteleop,autonomous\n')
+        output_path = self.path("csv.csv")
+        parser._filter_autonomous_logs_csv(input_path, output_path)
+        self.assertEqual(
+            self.read_bytes(output_path),
+            b'RobotMode,RobotMode\r\nteleop,autonomous\r\n',
+        )
+
+    @unittest.skipIf(parser.pl is None, "polars is not installed")
+    def test_polars_matches_csv(self):
+        input_path = self.write_input(SAMPLE_LOG)
+        polars_path = self.path("polars.csv")
+        csv_path = self.path("csv.csv")
+        parser._filter_autonomous_logs_polars(input_path, polars_path)
+        parser._filter_autonomous_logs_csv(input_path, csv_path)
+        self.assertEqual(self.read_bytes(polars_path), self.read_bytes(csv_path))
+
+    def test_unusual_inputs(self):
+        cases = [
+            ('', b''),
+            ('Timestamp,x\n1,2\n', b'Timestamp,x\r\n'),
+            ('Timestamp,RobotMode,x\n1,autonomous,a,b\n', b'Timestamp,RobotMode,x\r\n1,autonomous,a,b\r\n'),
+            ('Timestamp,RobotMode,x\n1,autonomous\n', b'Timestamp,RobotMode,x\r\n1,autonomous,\r\n'),
+            ('RobotMode,RobotMode\nautonomous,teleop\n', b'RobotMode,RobotMode\r\n'),
+            ('\ufeffTimestamp,RobotMode\n1,autonomous\n', b'\xef\xbb\xbfTimestamp,RobotMode\r\n1,autonomous\r\n'),
+            ('Timestamp,,RobotMode\n1,x,autonomous\n', b'Timestamp,,RobotMode\r\n1,x,autonomous\r\n'),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                input_path = self.write_input(text)
+                output_path = self.path("output.csv")
+                csv_path = self.path("csv.csv")
+                parser.filter_autonomous_logs(input_path, output_path)
+                parser._filter_autonomous_logs_csv(input_path, csv_path)
+                self.assertEqual(self.read_bytes(output_path), expected)
+                self.assertEqual(self.read_bytes(csv_path), expected)
+
+if __name__ == '__main__':
+    unittest.main()